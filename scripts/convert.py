@@ -1,17 +1,21 @@
 import os
+import sys
 
-def rename_files_in_directory(input_dir: str, output_subdir: str = 'outTxt') -> None:
+def rename_files_in_directory(input_dir: str, output_subdir: str = 'outTxt',
+                              verbose: bool = True) -> None:
     """
-    Renames all files ending with '.output' in the specified input directory by replacing 
+    Renames all files ending with '.output' in the specified input directory by replacing
     the extension with '.txt' and moves them to an output subdirectory.
 
-    The function creates the output subdirectory if it does not exist and skips any file 
+    The function creates the output subdirectory if it does not exist and skips any file
     that is the output subdirectory itself.
 
     Parameters:
         input_dir (str): The directory containing the files to rename.
         output_subdir (str): The name of the subdirectory where renamed files will be saved.
                              Defaults to 'outTxt'.
+        verbose (bool): If True, reports every rename on stdout (in one batched
+                        write at the end, so stdio does not dominate large runs).
 
     Returns:
         None
@@ -20,21 +24,25 @@ def rename_files_in_directory(input_dir: str, output_subdir: str = 'outTxt') ->
     output_dir = os.path.join(input_dir, output_subdir)
     os.makedirs(output_dir, exist_ok=True)
 
-    # Iterate over all files in the input directory
-    for filename in os.listdir(input_dir):
-        # Skip the output directory itself
-        if filename == output_subdir:
-            continue
+    log_lines = []
+    # Iterate over all entries in the input directory without materializing
+    # the full listing; the extension test runs on the DirEntry name.
+    with os.scandir(input_dir) as entries:
+        for entry in entries:
+            # Skip the output directory itself and anything not ending in .output
+            if entry.name == output_subdir or not entry.name.endswith('.output'):
+                continue
 
-        # Process files with the .output extension
-        if filename.endswith('.output'):
-            old_filepath = os.path.join(input_dir, filename)
-            new_filename = filename.rsplit('.output', 1)[0] + '.txt'
+            new_filename = entry.name[:-len('.output')] + '.txt'
             new_filepath = os.path.join(output_dir, new_filename)
-            
-            # Rename and move the file
-            os.rename(old_filepath, new_filepath)
-            print(f'Renamed {filename} to {new_filename} from {input_dir} to {output_dir}')
+
+            # Rename and move the file (os.replace is atomic on POSIX)
+            os.replace(entry.path, new_filepath)
+            if verbose:
+                log_lines.append(f'Renamed {entry.name} to {new_filename} from {input_dir} to {output_dir}\n')
+
+    if log_lines:
+        sys.stdout.write(''.join(log_lines))
 
 if __name__ == "__main__":
     """
@@ -0,0 +1,107 @@
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+# Compiled once at import time: matches every key of interest in a single
+# multiline pass over the file contents.
+_LOG_RE = re.compile(
+    r'^(problem_instance_file_name|number_of_mpi_processes|'
+    r'number_of_threads_per_process|wall_time_sec|'
+    r'is_within_time_limit|number_of_colors)\s*:\s*(.*?)\s*$',
+    re.M
+)
+
+# Number of distinct keys _LOG_RE can match; once this many have been seen
+# there is nothing left to extract from the file.
+_LOG_KEY_COUNT = _LOG_RE.pattern.count('|') + 1
+
+def _extract_raw(filename: str) -> dict:
+    """
+    Extracts the raw key/value strings from a log file, without type coercion.
+    """
+    with open(filename, 'r') as f:
+        text = f.read()
+
+    # Stop scanning as soon as every key has been seen: solver logs carry the
+    # keys near the top, so this skips regex work on the remainder of the file.
+    config_data = {}
+    for match in _LOG_RE.finditer(text):
+        config_data[match.group(1)] = match.group(2)
+        if len(config_data) == _LOG_KEY_COUNT:
+            break
+    return config_data
+
+@lru_cache(maxsize=100_000)
+def _parse_cached(filename: str, mtime_ns: int) -> tuple:
+    """
+    Parses a log file, caching the result keyed on (path, mtime).
+
+    The mtime_ns argument exists purely to invalidate the cache entry when the
+    file changes on disk; callers should go through `parse_log_file`, which
+    supplies it. The result is returned as a tuple of items so the cached
+    value is immutable.
+    """
+    config_data = _extract_raw(filename)
+
+    instance_name = config_data.get("problem_instance_file_name")
+    mpi_processes = int(config_data.get("number_of_mpi_processes", 0))
+    threads_per_process = int(config_data.get("number_of_threads_per_process", 0))
+    wall_time = float(config_data.get("wall_time_sec", float('nan')))
+    is_within_time_limit = config_data.get("is_within_time_limit") == "true"
+    num_colors = int(config_data.get("number_of_colors", 0))
+
+    return (
+        ("Instance", instance_name),
+        ("MPI Processes", mpi_processes),
+        ("Threads per Process", threads_per_process),
+        ("Wall Time (sec)", wall_time),
+        ("Within Time Limit", is_within_time_limit),
+        ("Colors", num_colors)
+    )
+
+def parse_log_file(filename: str) -> dict:
+    """
+    Parses a log file and extracts configuration and performance information.
+
+    The log file is expected to contain lines with key-value pairs separated by a colon.
+    The following keys are extracted (if present):
+      - problem_instance_file_name: Name of the problem instance.
+      - number_of_mpi_processes: Number of MPI processes (converted to int).
+      - number_of_threads_per_process: Number of threads per process (converted to int).
+      - wall_time_sec: Wall time in seconds (converted to float).
+      - is_within_time_limit: A flag indicating whether the run is within the time limit.
+      - number_of_colors: Number of colors (converted to int).
+
+    Results are cached on (path, mtime), so parsing the same unchanged file
+    again — e.g. from both tab_gen.py and visualize_speedup.py in the same
+    process, or across repeated calls — costs a single dict copy.
+
+    Parameters:
+        filename (str): The path to the log file.
+
+    Returns:
+        dict: A dictionary containing the extracted data with keys:
+            "Instance", "MPI Processes", "Threads per Process",
+            "Wall Time (sec)", "Within Time Limit", and "Colors".
+    """
+    return dict(_parse_cached(filename, os.stat(filename).st_mtime_ns))
+
+def collect_records(log_files_dir: str) -> list:
+    """
+    Parses every '.txt' log file in a directory into a list of record dicts.
+
+    Parsing is I/O-bound, so the reads overlap in a thread pool; unchanged
+    files are served from the shared parse cache.
+
+    Parameters:
+        log_files_dir (str): The directory containing the log files.
+
+    Returns:
+        list: One record dict per log file, as returned by `parse_log_file`.
+    """
+    with os.scandir(log_files_dir) as entries:
+        paths = [entry.path for entry in entries if entry.name.endswith(".txt")]
+
+    with ThreadPoolExecutor() as executor:
+        return list(executor.map(parse_log_file, paths))
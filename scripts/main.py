@@ -0,0 +1,30 @@
+from log_io import collect_records
+from tab_gen import sort_records, write_configuration_table
+from visualize_speedup import compute_speedup, visualize_speedup
+
+if __name__ == "__main__":
+    """
+    Main execution block.
+
+    Runs the full log post-processing pipeline with a single directory scan:
+    the log files are parsed once and the same records feed both the sorted
+    configuration table (tab_gen) and the speedup plots (visualize_speedup).
+
+    Expected log files location: '../build/output/outTxt'
+    Output CSV file: '../build/configuration_table_sorted.csv'
+    Output plots directory: '../build/plots'
+    """
+    log_files_directory = "../build/output/outTxt"
+    records = collect_records(log_files_directory)
+
+    if records:
+        output_filepath = "../build/configuration_table_sorted.csv"
+        write_configuration_table(sort_records(records), output_filepath)
+        print(f"Configuration table generated, sorted, and saved to {output_filepath}.")
+
+        speedup_data, min_colors = compute_speedup(records)
+        output_dir = "../build/plots"
+        visualize_speedup(speedup_data, min_colors, output_dir)
+        print(f"Speedup plots saved to the '{output_dir}' directory")
+    else:
+        print("No log files found or no data extracted.")
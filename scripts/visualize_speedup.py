@@ -1,97 +1,87 @@
 import os
-import re
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # plots are only written to files; skip GUI backend probes
 import matplotlib.pyplot as plt
 import seaborn as sns
 
-def parse_log_file(filename: str) -> tuple:
+from log_io import collect_records
+
+# Cheaper rasterization for the line plots below.
+plt.rcParams['path.simplify'] = True
+plt.rcParams['agg.path.chunksize'] = 10_000
+
+def compute_speedup(records: list) -> tuple:
     """
-    Parses a log file and extracts relevant performance information.
+    Calculates per-instance speedups and minimum colors from parsed records.
 
-    This function reads the log file line by line and extracts:
-      - problem_instance_file_name: The instance name.
-      - number_of_mpi_processes: The number of MPI processes.
-      - wall_time_sec: The wall clock time (in seconds).
-      - number_of_colors: The number of colors used.
+    The records are grouped by instance and the speedup is computed relative
+    to the baseline (1 MPI process). Instances without a 1-process baseline
+    are reported with a warning and skipped.
 
     Parameters:
-        filename (str): The full path to the log file.
+        records (list): Record dicts as returned by `log_io.collect_records`.
 
     Returns:
         tuple: A tuple containing:
-            - instance_name (str or None): The name of the problem instance.
-            - mpi_processes (int or None): The number of MPI processes.
-            - wall_time (float or None): The wall time in seconds.
-            - colors (int or None): The number of colors.
+            - speedup_data (dict): A dictionary mapping instance names to another
+              dictionary mapping MPI process counts to speedup values.
+            - min_colors (dict): A dictionary mapping instance names to the minimum
+              number of colors found in the log files.
     """
-    instance_name = None
-    mpi_processes = None
-    wall_time = None
-    colors = None
-
-    with open(filename, 'r') as f:
-        for line in f:
-            if "problem_instance_file_name:" in line:
-                instance_name = line.split(":", 1)[1].strip()
-            elif "number_of_mpi_processes:" in line:
-                mpi_processes = int(line.split(":", 1)[1].strip())
-            elif "wall_time_sec:" in line:
-                wall_time = float(line.split(":", 1)[1].strip())
-            elif "number_of_colors:" in line:
-                colors = int(line.split(":", 1)[1].strip())
-
-    return instance_name, mpi_processes, wall_time, colors
+    df = pd.DataFrame(records)
+    if df.empty:
+        return {}, {}
+
+    # Keep only complete records; all further work is columnar.
+    df = df[df["Instance"].notna() & (df["MPI Processes"] > 0) & df["Wall Time (sec)"].notna()]
+
+    min_colors = df.groupby("Instance")["Colors"].min().to_dict()
+
+    # Vectorized speedup: map each row to its instance's 1-process baseline.
+    baseline = (
+        df.loc[df["MPI Processes"] == 1]
+          .drop_duplicates("Instance", keep="last")
+          .set_index("Instance")["Wall Time (sec)"]
+    )
+    df["Speedup"] = df["Instance"].map(baseline) / df["Wall Time (sec)"]
+
+    for instance in df.loc[df["Speedup"].isna(), "Instance"].unique():
+        print(f"Warning: No 1-MPI process data found for instance {instance}. Speedup calculation skipped.")
+
+    speedup_data = {
+        instance: dict(zip(group["MPI Processes"], group["Speedup"]))
+        for instance, group in df.dropna(subset=["Speedup"]).groupby("Instance")
+    }
+
+    return speedup_data, min_colors
 
 def analyze_performance_data(log_files_dir: str) -> tuple:
     """
     Analyzes performance data from log files and calculates the speedup.
 
-    For each log file in the specified directory (files ending with '.txt'),
-    the function extracts the instance name, MPI process count, wall time, and
-    number of colors. It then groups the data by instance and computes the speedup
-    relative to the baseline (1 MPI process).
-
-    If a log file for a given instance does not have data for 1 MPI process,
-    the speedup calculation for that instance is skipped.
+    Convenience wrapper around `log_io.collect_records` and `compute_speedup`
+    for running this script on its own; main.py parses the logs once and
+    calls `compute_speedup` directly.
 
     Parameters:
         log_files_dir (str): The directory containing log files.
 
     Returns:
-        tuple: A tuple containing:
-            - speedup_data (dict): A dictionary mapping instance names to another
-              dictionary mapping MPI process counts to speedup values.
-            - min_colors (dict): A dictionary mapping instance names to the minimum
-              number of colors found in the log files.
+        tuple: The (speedup_data, min_colors) pair from `compute_speedup`.
     """
-    performance_data = {}
-    min_colors = {}
-
-    for filename in os.listdir(log_files_dir):
-        if filename.endswith(".txt"):
-            filepath = os.path.join(log_files_dir, filename)
-            instance_name, mpi_processes, wall_time, num_colors = parse_log_file(filepath)
-
-            if instance_name and mpi_processes and wall_time is not None:
-                if instance_name not in performance_data:
-                    performance_data[instance_name] = {}
-                    min_colors[instance_name] = num_colors  # Initialize with the first encountered value
-
-                performance_data[instance_name][mpi_processes] = wall_time
-                # Update the minimum colors value if a lower value is found
-                min_colors[instance_name] = min(min_colors[instance_name], num_colors)
-
-    speedup_data = {}
-    for instance, mpi_times in performance_data.items():
-        if 1 in mpi_times:  # Ensure baseline exists for 1 MPI process
-            speedup_data[instance] = {}
-            base_time = mpi_times[1]
-            for processes, time in mpi_times.items():
-                speedup_data[instance][processes] = base_time / time
-        else:
-            print(f"Warning: No 1-MPI process data found for instance {instance}. Speedup calculation skipped.")
+    return compute_speedup(collect_records(log_files_dir))
 
-    return speedup_data, min_colors
+def _write_png(buf: BytesIO, path: str) -> None:
+    """
+    Writes an in-memory PNG buffer to disk; run on a worker thread so disk
+    I/O overlaps with rendering the next figure.
+    """
+    with open(path, 'wb') as f:
+        f.write(buf.getbuffer())
 
 def visualize_speedup(speedup_data: dict, min_colors: dict, output_dir: str) -> None:
     """
@@ -102,7 +92,9 @@ def visualize_speedup(speedup_data: dict, min_colors: dict, output_dir: str) ->
          - X-axis: Number of MPI Processes.
          - Y-axis: Speedup (relative to 1 MPI process).
          - Title includes the instance name and its minimum number of colors.
-      2. A global average speedup plot:
+      2. A combined grid of all instance curves (speedup_grid.png), rendered
+         in one seaborn relplot call.
+      3. A global average speedup plot:
          - X-axis: Number of MPI Processes.
          - Y-axis: Average speedup computed across all instances.
 
@@ -115,45 +107,76 @@ def visualize_speedup(speedup_data: dict, min_colors: dict, output_dir: str) ->
     """
     os.makedirs(output_dir, exist_ok=True)
 
+    # One Figure/Axes pair is reused for every plot: clearing the axes is much
+    # cheaper than creating and tearing down a figure per instance.
+    fig, ax = plt.subplots(figsize=(10, 6))
+
+    # PNGs are rendered to memory on the main thread (the figure above is
+    # cleared and reused, so it cannot be rasterized concurrently) while the
+    # disk writes overlap on worker threads. The futures are kept so write
+    # errors propagate instead of vanishing inside the pool.
+    writer_pool = ThreadPoolExecutor()
+    write_futures = []
+
     # Generate instance-specific speedup plots
     for instance, speedups in speedup_data.items():
-        mpi_processes = sorted(speedups.keys())
-        speedup_values = [speedups[p] for p in mpi_processes]
-
-        plt.figure(figsize=(10, 6))
-        plt.plot(mpi_processes, speedup_values, marker='o')
-        plt.xlabel("Number of MPI Processes")
-        plt.ylabel("Speedup (relative to 1 MPI process)")
-        plt.title(f"Speedup for Instance: {instance} (Colors: {min_colors[instance]})")
-        plt.xticks(mpi_processes)
-        plt.grid(True)
-        plt.savefig(os.path.join(output_dir, f"speedup_{instance}.png"))
-        plt.close()
-
-    # Generate a global average speedup plot
-    global_speedup = {}
-    all_processes = set()
-    for speedups in speedup_data.values():
-        all_processes.update(speedups.keys())
-    sorted_processes = sorted(list(all_processes))
-
-    for p in sorted_processes:
-        times_for_process = []
-        for instance in speedup_data:
-            if p in speedup_data[instance]:
-                times_for_process.append(speedup_data[instance][p])
-        if times_for_process:
-            global_speedup[p] = sum(times_for_process) / len(times_for_process)
-
-    plt.figure(figsize=(10, 6))
-    plt.plot(sorted_processes, [global_speedup[p] for p in sorted_processes], marker='o')
-    plt.xlabel("Number of MPI Processes")
-    plt.ylabel("Average Speedup")
-    plt.title("Global Average Speedup Across Instances")
-    plt.xticks(sorted_processes)
-    plt.grid(True)
-    plt.savefig(os.path.join(output_dir, "global_speedup.png"))
-    plt.close()
+        # Sort key/value pairs in one pass instead of sorting the keys and
+        # looking each one up again.
+        mpi_processes, speedup_values = zip(*sorted(speedups.items()))
+
+        ax.clear()
+        ax.plot(mpi_processes, speedup_values, marker='o')
+        ax.set_xlabel("Number of MPI Processes")
+        ax.set_ylabel("Speedup (relative to 1 MPI process)")
+        ax.set_title(f"Speedup for Instance: {instance} (Colors: {min_colors[instance]})")
+        ax.set_xticks(mpi_processes)
+        ax.grid(True)
+        buf = BytesIO()
+        fig.savefig(buf, format='png')
+        write_futures.append(
+            writer_pool.submit(_write_png, buf, os.path.join(output_dir, f"speedup_{instance}.png")))
+
+    # Generate one combined grid of all instance curves: a single tidy frame
+    # and one seaborn relplot call batch-render every facet in one pass.
+    tidy = pd.DataFrame(
+        [(instance, procs, speedup)
+         for instance, speedups in speedup_data.items()
+         for procs, speedup in speedups.items()],
+        columns=["instance", "procs", "speedup"]
+    )
+    if not tidy.empty:
+        grid = sns.relplot(data=tidy, x="procs", y="speedup", col="instance",
+                           kind="line", marker='o', col_wrap=4)
+        grid.set_axis_labels("Number of MPI Processes", "Speedup (relative to 1 MPI process)")
+        buf = BytesIO()
+        grid.savefig(buf, format='png')
+        write_futures.append(
+            writer_pool.submit(_write_png, buf, os.path.join(output_dir, "speedup_grid.png")))
+        plt.close(grid.figure)
+
+    # Generate a global average speedup plot: a wide frame (process counts x
+    # instances, NaN where an instance lacks a run) reduces the nested loops
+    # to one C-level skipna mean per process count.
+    global_speedup = pd.DataFrame(speedup_data).mean(axis=1).sort_index()
+
+    ax.clear()
+    ax.plot(global_speedup.index, global_speedup.values, marker='o')
+    ax.set_xlabel("Number of MPI Processes")
+    ax.set_ylabel("Average Speedup")
+    ax.set_title("Global Average Speedup Across Instances")
+    ax.set_xticks(global_speedup.index)
+    ax.grid(True)
+    buf = BytesIO()
+    fig.savefig(buf, format='png')
+    write_futures.append(
+        writer_pool.submit(_write_png, buf, os.path.join(output_dir, "global_speedup.png")))
+    plt.close(fig)
+
+    # Block until every queued PNG has reached disk; result() re-raises any
+    # write error (permissions, disk full, ...) that a worker thread hit.
+    for future in write_futures:
+        future.result()
+    writer_pool.shutdown(wait=True)
 
 if __name__ == "__main__":
     """